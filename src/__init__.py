@@ -1,4 +1,4 @@
-from .api import generate_topology
+from .api import generate_topology, generate_topology_from_data
 from .config import TopologyConfig
 from .exceptions import (
     MeshTopologyError,
@@ -10,6 +10,7 @@ from .exceptions import (
 
 __all__ = [
     'generate_topology',
+    'generate_topology_from_data',
     'TopologyConfig',
     'MeshTopologyError',
     'InvalidInputError',
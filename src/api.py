@@ -1,38 +1,112 @@
-import json
+import functools
+from .jsonutil import loads as _loads, dumps as _dumps, dumps_sorted as _dumps_sorted, JSONDecodeError
 import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from .config import TopologyConfig
 from .models import NodeInfo, EdgeInfo
 from .topology_generator import TopologyGenerator
 from .exceptions import MeshTopologyError, InvalidInputError, TopologyGenerationError
-from .validators import validate_topology_input
+from .validators import validate_topology_data
 from .logger_config import setup_logger
 import os
 from datetime import datetime
 
 logger = setup_logger(__name__, '/var/log/topo-planner/topo-planner.log')
 
-def generate_topology(nodes_json: str, edges_json: str, config_json: str = None) -> str:
+# 错误日志默认不携带完整堆栈（traceback格式化开销大），排查时置TOPO_LOG_EXC=1打开
+_USE_EXC_INFO = os.getenv('TOPO_LOG_EXC', '0') == '1'
+
+# 结果目录只需创建一次，避免每次写入都多一次stat
+_RESULT_DIR = "/app/results"
+os.makedirs(_RESULT_DIR, exist_ok=True)
+
+# 结果文件写盘放到后台线程，不阻塞请求路径
+_WRITER = ThreadPoolExecutor(max_workers=2, thread_name_prefix='topo-writer')
+
+# 输出字段映射：一次性绑定attrgetter，避免结果构建循环中的逐属性查找
+_node_fields = operator.attrgetter(
+    'parent', 'backhaul_band', 'level', 'channel', 'bandwidth', 'max_eirp', 'gps'
+)
+_result_keys = ('parent', 'backhaulBand', 'level', 'channel', 'bandwidth', 'maxEirp', 'gps')
+
+def _node_to_dict(node) -> dict:
+    """序列化default钩子：把TopologyNode转成对外的camelCase字段dict"""
+    return dict(zip(_result_keys, _node_fields(node)))
+
+def _log_write_failure(future) -> None:
+    """后台写盘的done回调：失败（磁盘满、权限等）时记录日志，不让异常无声丢失"""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"保存拓扑结果失败: {str(exc)}", exc_info=_USE_EXC_INFO)
+
+def generate_topology(nodes_json: str, edges_json: str, config_json: str = None) -> bytes:
     """
     供Java调用的API接口
-    
+
     Args:
         nodes_json: 节点信息的JSON字符串
         edges_json: 边信息的JSON字符串
         config_json: 可选的配置信息JSON字符串
-    
+
+    Returns:
+        拓扑结果的UTF-8编码JSON字节串（调用方可直接按UTF-8构造字符串，
+        避免一次多余的解码/再编码）
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("输入参数: nodes_json长度=%d, edges_json长度=%d, config_json长度=%d",
+                    len(nodes_json), len(edges_json),
+                    len(config_json) if config_json else 0)
+
+    # 解析一次后走dict流程，后续的验证和缓存键计算都不再碰JSON文本
+    try:
+        nodes_data = _loads(nodes_json)
+        edges_data = _loads(edges_json)
+        config_data = _loads(config_json) if config_json else None
+    except Exception as e:
+        logger.error(f"JSON解析失败: {e}", exc_info=_USE_EXC_INFO)
+        return _dumps({
+            'status': 'error',
+            'error_type': 'InvalidInputError',
+            'message': f"JSON解析错误: {str(e)}"
+        })
+
+    return generate_topology_from_data(nodes_data, edges_data, config_data)
+
+def generate_topology_from_data(nodes_data: Dict, edges_data: Dict, config_data: Dict = None) -> bytes:
+    """
+    供HTTP层调用的dict入口：请求体已由Pydantic解析，直接进入验证/生成流程
+
     Returns:
-        拓扑结果的JSON字符串
+        拓扑结果的UTF-8编码JSON字节串
     """
     logger.info("开始生成拓扑")
-    logger.debug(f"输入参数: nodes_json长度={len(nodes_json)}, "
-                f"edges_json长度={len(edges_json)}, "
-                f"config_json={'已提供' if config_json else '未提供'}")
-    
+
+    # 同一张网的周期性刷新会重复提交相同输入，先规范化（键排序）作为缓存键，
+    # 命中时直接返回上次的结果，跳过整个验证/生成/分配流程
+    try:
+        nodes_key = _dumps_sorted(nodes_data)
+        edges_key = _dumps_sorted(edges_data)
+        config_key = _dumps_sorted(config_data) if config_data else None
+    except Exception:
+        # 无法序列化的输入不进缓存，交给核心流程产生统一的错误响应
+        return _generate_topology_core(nodes_data, edges_data, config_data)
+
+    return _generate_cached(nodes_key, edges_key, config_key)
+
+@functools.lru_cache(maxsize=64)
+def _generate_cached(nodes_key: bytes, edges_key: bytes, config_key: bytes) -> bytes:
+    """以规范化输入为键缓存完整的生成结果（未命中时解析规范化字节串重建dict）"""
+    return _generate_topology_core(_loads(nodes_key), _loads(edges_key),
+                                   _loads(config_key) if config_key else None)
+
+def _generate_topology_core(nodes_data, edges_data, config_data) -> bytes:
+    """实际的验证、生成、信道分配与序列化流程"""
     try:
         # 验证并转换输入数据
-        nodes, edges, config = validate_topology_input(nodes_json, edges_json, config_json)
-            
+        nodes, edges, config = validate_topology_data(nodes_data, edges_data, config_data)
+
         # 生成拓扑
         generator = TopologyGenerator(config)
         topology = generator.generate(nodes, edges)
@@ -40,97 +114,94 @@ def generate_topology(nodes_json: str, edges_json: str, config_json: str = None)
         if not topology:
             raise TopologyGenerationError("无法生成有效的网络拓扑")
             
-        # 转换结果为dict并序列化
-        result = {
-            node_id: {
-                'parent': node.parent,
-                'backhaulBand': node.backhaul_band,
-                'level': node.level,
-                'channel': node.channel,
-                'bandwidth': node.bandwidth,
-                'maxEirp': node.max_eirp,
-                'gps': node.gps
-            }
-            for node_id, node in topology.items()
-        }
-
-        node_count = len(nodes)
-        save_topology_result(json.dumps({
-            'status': 'success',
-            'data': result
-        }), node_count)
-        
-        return json.dumps({
+        # 序列化时经default钩子直接转换TopologyNode，不再预建整个结果dict
+        payload = _dumps({
             'status': 'success',
-            'data': result
-        })
+            'data': topology
+        }, default=_node_to_dict)
+
+        _WRITER.submit(save_topology_result, payload, len(nodes)) \
+               .add_done_callback(_log_write_failure)
+
+        return payload
         
     except MeshTopologyError as e:
-        logger.error(f"拓扑生成错误: {str(e)}", exc_info=True)
-        return json.dumps({
+        logger.error(f"拓扑生成错误: {str(e)}", exc_info=_USE_EXC_INFO)
+        return _dumps({
             'status': 'error',
             'error_type': e.__class__.__name__,
             'message': str(e)
         })
     except Exception as e:
-        logger.error(f"未预期的错误: {str(e)}", exc_info=True)
-        return json.dumps({
+        logger.error(f"未预期的错误: {str(e)}", exc_info=_USE_EXC_INFO)
+        return _dumps({
             'status': 'error',
             'error_type': 'UnexpectedError',
             'message': '系统内部错误'
         })
 
-def save_topology_result(result: str, node_count: int) -> str:
+def save_topology_result(result: bytes, node_count: int) -> str:
     """保存拓扑结果到文件"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     filename = f"topology_{node_count}nodes_{timestamp}.json"
-    result_dir = "/app/results"
-    
-    # 确保目录存在
-    os.makedirs(result_dir, exist_ok=True)
-    
-    filepath = os.path.join(result_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
+
+    filepath = f"{_RESULT_DIR}/{filename}"
+    with open(filepath, 'wb') as f:
         f.write(result)
-        
+
     return filename
 
-def list_topology_results():
-    """列出所有拓扑结果文件，按文件修改时间排序"""
-    result_dir = "/app/results"
-    results = []
-    
-    # 获取所有符合条件的文件
-    filenames = [f for f in os.listdir(result_dir) 
-                if f.startswith('topology_') and f.endswith('.json')]
-    
-    for filename in filenames:
-        filepath = os.path.join(result_dir, filename)
+@functools.lru_cache(maxsize=4096)
+def _load_cached(path: str, mtime_ns: int) -> dict:
+    """读取并解析结果文件，以(路径, mtime_ns)为键缓存
+
+    结果文件写入后不再修改，mtime变化时缓存键自动失效。
+    """
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+# 结果文件只增不改，目录mtime不变即意味着文件集合没变，
+# 整个列表可直接复用上次的结果，热路径上只剩一次stat
+_listing_cache: Dict[bool, tuple] = {}
+
+def list_topology_results(include_data: bool = True):
+    """列出所有拓扑结果文件，按文件修改时间排序
+
+    Args:
+        include_data: 为False时只返回文件名和修改时间，不读取文件内容
+    """
+    dir_mtime = os.stat(_RESULT_DIR).st_mtime_ns
+    cached = _listing_cache.get(include_data)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+
+    # 单次scandir遍历，DirEntry.stat()复用读目录时缓存的元数据，减少一半syscall
+    with os.scandir(_RESULT_DIR) as it:
+        entries = [e for e in it
+                   if e.name.startswith('topology_') and e.name.endswith('.json')]
+
+    # 先按修改时间降序排序，再打开文件解析内容
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+
+    if not include_data:
+        listing = [{'filename': e.name, 'mtime': e.stat().st_mtime} for e in entries]
+        _listing_cache[include_data] = (dir_mtime, listing)
+        return listing
+
+    def _read(entry):
         try:
-            # 获取文件修改时间
-            file_timestamp = datetime.fromtimestamp(os.path.getmtime(filepath))
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"文件: {filename}, 修改时间: {file_timestamp}")
-                results.append({
-                    'filename': filename,
-                    'data': data,
-                    'timestamp': file_timestamp
-                })
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"处理文件 {filename} 时出错: {str(e)}")
-            continue
-    
-    # 按文件修改时间排序
-    results.sort(key=lambda x: x['timestamp'], reverse=True)
-    
-    # 打印排序后的结果
-    logger.debug("排序后的文件列表:")
-    for result in results:
-        logger.debug(f"{result['filename']}: {result['timestamp']}")
-    
-    # 移除timestamp字段
-    for result in results:
-        del result['timestamp']
-    
-    return results
+            data = _load_cached(entry.path, entry.stat().st_mtime_ns)
+            logger.debug("文件: %s, 修改时间: %s", entry.name, entry.stat().st_mtime)
+            return data
+        except (JSONDecodeError, IOError) as e:
+            logger.error(f"处理文件 {entry.name} 时出错: {str(e)}")
+            return None
+
+    # 文件读取释放GIL，用线程池并行，读取延迟从串行O(N)降到O(N/并发数)
+    with ThreadPoolExecutor(max_workers=16, thread_name_prefix='topo-reader') as ex:
+        loaded = list(ex.map(_read, entries))
+
+    listing = [{'filename': entry.name, 'data': data}
+               for entry, data in zip(entries, loaded) if data is not None]
+    _listing_cache[include_data] = (dir_mtime, listing)
+    return listing
@@ -1,5 +1,7 @@
 from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict
+from functools import reduce
+from operator import or_
 from .config import TopologyConfig
 from .models import NodeInfo, EdgeInfo, TopologyNode
 from .exceptions import ChannelAssignmentError
@@ -11,56 +13,75 @@ logger = logging.getLogger(__name__)
 class ChannelAssigner:
     def __init__(self, config: TopologyConfig):
         self.config = config
-        
-    def _get_level_nodes(self, 
-                         topology: Dict[str, TopologyNode]) -> Dict[int, List[str]]:
-        """按层级对节点进行分组"""
-        level_nodes = defaultdict(list)
-        for node_id, node in topology.items():
-            level_nodes[node.level].append(node_id)
-        return dict(level_nodes)
-        
+        self._conflict_adj: Dict[str, Set[str]] = {}
+        self._eirp_map: Dict[str, Dict[str, Dict[str, Dict[int, float]]]] = {}
+        self._device_mask: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._used_mask: Dict[str, int] = defaultdict(int)
+
+    def _build_device_masks(self,
+                           node_info: Dict[str, NodeInfo]) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """把设备支持的信道集合压成整型位掩码
+
+        信道号是小整数，压成位掩码后可用信道计算变成一次按位与，
+        热路径上不再构造set、也不再逐元素做差集。
+        """
+        masks = {}
+        for node_id, info in node_info.items():
+            masks[node_id] = {
+                band: {bw: reduce(or_, (1 << c for c in channels), 0)
+                       for bw, channels in bw_channels.items()}
+                for band, bw_channels in info.channels.items()
+            }
+        return masks
+
+    def _build_eirp_map(self,
+                       node_info: Dict[str, NodeInfo]) -> Dict[str, Dict[str, Dict[str, Dict[int, float]]]]:
+        """预建 信道->EIRP 映射，替代热路径上list.index的线性查找"""
+        eirp_map = {}
+        for node_id, info in node_info.items():
+            node_map = {}
+            for band, bw_channels in info.channels.items():
+                band_eirp = info.max_eirp[band]
+                node_map[band] = {
+                    bw: dict(zip(channels, band_eirp[bw]))
+                    for bw, channels in bw_channels.items()
+                }
+            eirp_map[node_id] = node_map
+        return eirp_map
+
+    def _build_conflict_adjacency(self,
+                                 edges: Dict[Tuple[str, str], EdgeInfo]) -> Dict[str, Set[str]]:
+        """单次遍历边表，预建信道冲突邻接表
+
+        原先每个节点分配信道时都全量扫描边表，整体为O(N·E)；
+        预建邻接表后单节点查询是O(1)，总代价只有一次O(E)遍历。
+        """
+        conflict_adj = defaultdict(set)
+        threshold = self.config.RSSI_CONFLICT_THRESHOLD
+        for (n1, n2), edge in edges.items():
+            if edge.rssi_max >= threshold:
+                conflict_adj[n1].add(n2)
+                conflict_adj[n2].add(n1)
+        return conflict_adj
+
+
     def _sort_nodes_by_load(self,
                            nodes: List[str],
                            node_info: Dict[str, NodeInfo]) -> List[str]:
         """按负载对节点进行排序"""
         return sorted(nodes, key=lambda x: node_info[x].load, reverse=True)
         
-    def _get_conflict_nodes(self,
-                           node_id: str,
-                           topology: Dict[str, TopologyNode],
-                           edges: Dict[Tuple[str, str], EdgeInfo]) -> Set[str]:
+    def _get_conflict_nodes(self, node_id: str) -> Set[str]:
         """获取可能存在信道冲突的节点集合"""
-        conflict_nodes = set()
-        for (n1, n2), edge in edges.items():
-            if node_id not in (n1, n2):
-                continue
-            other_node = n2 if node_id == n1 else n1
-            # 检查RSSI是否超过冲突阈值
-            rssi_values = edge.rssi_6gh + edge.rssi_6gl
-            if max(rssi_values) >= self.config.RSSI_CONFLICT_THRESHOLD:
-                conflict_nodes.add(other_node)
-        return conflict_nodes
+        return self._conflict_adj.get(node_id, set())
         
     def _get_available_channels(self,
                               node_id: str,
                               band: str,
                               bandwidth: str,
-                              node_info: Dict[str, NodeInfo],
-                              conflict_nodes: Set[str],
-                              topology: Dict[str, TopologyNode]) -> List[int]:
-        """获取可用信道列表"""
-        # 获取设备支持的信道
-        device_channels = set(node_info[node_id].channels[band][bandwidth])
-        
-        # 获取冲突设备已使用的信道
-        used_channels = set()
-        for conflict_node in conflict_nodes:
-            if conflict_node in topology and topology[conflict_node].channel:
-                used_channels.update(topology[conflict_node].channel)
-                
-        # 返回可用信道
-        return list(device_channels - used_channels)
+                              used_mask: int) -> int:
+        """获取可用信道位掩码：设备支持的信道去掉冲突邻居已占用的"""
+        return self._device_mask[node_id][band][bandwidth] & ~used_mask
         
     def _assign_root_channels(self,
                             root_id: str,
@@ -73,13 +94,15 @@ class ChannelAssigner:
             topology[root_id].channel.append(high_channels[0])
             topology[root_id].bandwidth.append(160)
             topology[root_id].max_eirp.append(node_info[root_id].max_eirp['6GH']['160M'][0])
-            
+            self._used_mask[root_id] |= 1 << high_channels[0]
+
         # 为根节点低频分配160M信道
         low_channels = node_info[root_id].channels['6GL']['160M']
         if low_channels:
             topology[root_id].channel.append(low_channels[0])
             topology[root_id].bandwidth.append(160)
             topology[root_id].max_eirp.append(node_info[root_id].max_eirp['6GL']['160M'][0])
+            self._used_mask[root_id] |= 1 << low_channels[0]
             
     def _try_assign_channel(self,
                            node_id: str,
@@ -88,29 +111,32 @@ class ChannelAssigner:
                            node_info: Dict[str, NodeInfo],
                            edges: Dict[Tuple[str, str], EdgeInfo]) -> bool:
         """尝试为节点分配信道"""
-        conflict_nodes = self._get_conflict_nodes(node_id, topology, edges)
-        
+        conflict_nodes = self._get_conflict_nodes(node_id)
+
+        # 冲突邻居已占用信道的并集掩码，各带宽档位间复用
+        used_mask = 0
+        for conflict_node in conflict_nodes:
+            used_mask |= self._used_mask[conflict_node]
+
         # 按带宽从大到小尝试分配
         for bandwidth in ['160M', '80M', '40M', '20M']:
-            available_channels = self._get_available_channels(
-                node_id, band, bandwidth,
-                node_info, conflict_nodes, topology
-            )
-            
-            if available_channels:
-                # 分配第一个可用信道
-                channel = available_channels[0]
+            available = self._get_available_channels(node_id, band, bandwidth, used_mask)
+
+            if available:
+                # 取编号最小的可用信道（最低有效位）
+                lowest_bit = available & -available
+                channel = lowest_bit.bit_length() - 1
                 bw = int(bandwidth[:-1])
-                topology[node_id].channel.append(channel)
-                topology[node_id].bandwidth.append(bw)
-                
-                # 获取对应的最大发射功率
-                channel_index = node_info[node_id].channels[band][bandwidth].index(channel)
-                max_eirp = node_info[node_id].max_eirp[band][bandwidth][channel_index]
-                topology[node_id].max_eirp.append(max_eirp)
-                
+                node = topology[node_id]
+                node.channel.append(channel)
+                node.bandwidth.append(bw)
+                self._used_mask[node_id] |= lowest_bit
+
+                # 预建映射直接取对应的最大发射功率
+                node.max_eirp.append(self._eirp_map[node_id][band][bandwidth][channel])
+
                 return True
-                
+
         return False
         
     def assign_channels(self,
@@ -123,25 +149,36 @@ class ChannelAssigner:
             if not topology:
                 raise ChannelAssignmentError("拓扑结构为空")
                 
-            # 获取根节点
-            try:
-                root_id = next(node_id for node_id, node in topology.items() 
-                              if node.parent is None)
-            except StopIteration:
+            # 单次遍历拓扑，同时完成根节点查找和层级分桶
+            # 层级从0开始连续，按list下标分桶即天然有序，省去dict哈希和sorted
+            root_id = None
+            level_buckets: List[List[str]] = []
+            for node_id, node in topology.items():
+                level = node.level
+                while len(level_buckets) <= level:
+                    level_buckets.append([])
+                level_buckets[level].append(node_id)
+                if node.parent is None:
+                    root_id = node_id
+
+            if root_id is None:
                 raise ChannelAssignmentError("拓扑中未找到根节点")
-            
+
+            # 冲突邻接表、信道->EIRP映射和设备信道掩码整个分配过程只建一次
+            self._conflict_adj = self._build_conflict_adjacency(edges)
+            self._eirp_map = self._build_eirp_map(nodes)
+            self._device_mask = self._build_device_masks(nodes)
+            self._used_mask = defaultdict(int)
+
             # 为根节点分配信道
             try:
                 self._assign_root_channels(root_id, topology, nodes)
             except Exception as e:
                 raise ChannelAssignmentError(f"根节点信道分配失败: {str(e)}")
             
-            # 按层次获取节点
-            level_nodes = self._get_level_nodes(topology)
-            
             # 从第一层开始逐层分配
-            for level in sorted(level_nodes.keys())[1:]:
-                sorted_nodes = self._sort_nodes_by_load(level_nodes[level], nodes)
+            for level in range(1, len(level_buckets)):
+                sorted_nodes = self._sort_nodes_by_load(level_buckets[level], nodes)
                 
                 for node_id in sorted_nodes:
                     try:
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TopologyConfig:
     MAX_DEGREE: int = 3
     RSSI_THRESHOLD: int = -72
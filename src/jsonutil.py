@@ -0,0 +1,46 @@
+"""JSON编解码的统一入口
+
+优先使用orjson（C实现，解析和序列化都显著快于标准库），
+orjson不可用时退回标准库json，接口保持一致：dumps始终返回UTF-8字节串。
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """解析JSON字符串或字节串"""
+        return orjson.loads(data)
+
+    def dumps(obj, default=None) -> bytes:
+        """序列化为UTF-8编码的JSON字节串
+
+        指定default钩子时dataclass实例交给钩子处理，
+        而不是走orjson的原生dataclass序列化（后者无法重命名字段）。
+        """
+        if default is not None:
+            return orjson.dumps(obj, default=default,
+                                option=orjson.OPT_PASSTHROUGH_DATACLASS)
+        return orjson.dumps(obj)
+
+    def dumps_sorted(obj) -> bytes:
+        """键按字典序排序的序列化，用于生成与输入键序无关的缓存键"""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """解析JSON字符串或字节串"""
+        return json.loads(data)
+
+    def dumps(obj, default=None) -> bytes:
+        """序列化为UTF-8编码的JSON字节串"""
+        return json.dumps(obj, ensure_ascii=False, default=default).encode()
+
+    def dumps_sorted(obj) -> bytes:
+        """键按字典序排序的序列化，用于生成与输入键序无关的缓存键"""
+        return json.dumps(obj, ensure_ascii=False, sort_keys=True).encode()
+
+    JSONDecodeError = json.JSONDecodeError
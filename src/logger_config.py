@@ -1,12 +1,39 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+# 已配置的logger缓存，键为(name, log_file)：
+# 同一进程内重复调用直接命中，连getLogger和handler检查都省掉
+_loggers = {}
+
+# 持有后台监听器的引用，防止被GC回收导致日志线程退出
+_listeners = []
+
+def _stop_listeners() -> None:
+    """进程退出时停止所有监听器，把队列里残留的日志刷到文件"""
+    for listener in _listeners:
+        listener.stop()
+
+atexit.register(_stop_listeners)
 
 def setup_logger(name: str, log_file: str = None) -> logging.Logger:
+    cached = _loggers.get((name, log_file))
+    if cached is not None:
+        return cached
+
     # 创建logger
     logger = logging.getLogger(name)
+
+    # 已配置过则直接返回，避免重复添加handler导致每条日志多次格式化输出
+    if logger.handlers:
+        _loggers[(name, log_file)] = logger
+        return logger
+
     logger.setLevel(logging.DEBUG)
-    
+
     # 创建控制台处理器
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
@@ -18,19 +45,27 @@ def setup_logger(name: str, log_file: str = None) -> logging.Logger:
     
     # 设置格式器
     ch.setFormatter(formatter)
-    
-    # 添加控制台处理器
-    logger.addHandler(ch)
-    
+
+    handlers = [ch]
+
     # 如果指定了日志文件，添加文件处理器
     if log_file:
         # 确保日志目录存在
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        
+
         # 创建文件处理器
         fh = logging.FileHandler(log_file, encoding='utf-8')
         fh.setLevel(logging.DEBUG)
         fh.setFormatter(formatter)
-        logger.addHandler(fh)
-    
-    return logger 
\ No newline at end of file
+        handlers.append(fh)
+
+    # 实际的格式化和write()+flush()放到后台监听线程，
+    # 请求路径上打日志只剩一次queue.put，不会阻塞事件循环
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+    _loggers[(name, log_file)] = logger
+    return logger
\ No newline at end of file
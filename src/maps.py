@@ -8,12 +8,15 @@ load_dotenv()
 
 router = APIRouter()
 
+# API key在进程生命周期内不变，导入时解析一次并缓存响应
+_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
+_CACHED_RESPONSE = {"key": _API_KEY} if _API_KEY else None
+
 @router.get("/key", response_model=Dict[str, str])
-async def get_maps_key():
-    api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    if not api_key:
+def get_maps_key():
+    if _CACHED_RESPONSE is None:
         raise HTTPException(
             status_code=500,
             detail="Google Maps API key not configured"
         )
-    return {"key": api_key} 
\ No newline at end of file
+    return _CACHED_RESPONSE 
\ No newline at end of file
@@ -1,19 +1,38 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class NodeInfo:
     gps: Tuple[float, float]
     load: float
     channels: Dict[str, Dict[str, List[int]]]
     max_eirp: Dict[str, Dict[str, List[int]]]
 
-@dataclass
+    @classmethod
+    def _from_raw(cls, data: Dict[str, Any]) -> 'NodeInfo':
+        """从解析后的dict按位置构造，省去**kwargs展开的开销"""
+        return cls(data['gps'], data['load'], data['channels'], data['max_eirp'])
+
+@dataclass(slots=True)
 class EdgeInfo:
     rssi_6gh: Tuple[int, int]
     rssi_6gl: Tuple[int, int]
+    # 整条边的最大RSSI在热路径上反复用到，构造时算好存下
+    rssi_max: int = field(init=False)
+
+    def __post_init__(self):
+        # JSON解析得到的是list，统一转成不可变tuple再预计算最大值
+        self.rssi_6gh = tuple(self.rssi_6gh)
+        self.rssi_6gl = tuple(self.rssi_6gl)
+        self.rssi_max = max(self.rssi_6gh[0], self.rssi_6gh[1],
+                            self.rssi_6gl[0], self.rssi_6gl[1])
+
+    @classmethod
+    def _from_raw(cls, data: Dict[str, Any]) -> 'EdgeInfo':
+        """从解析后的dict按位置构造，省去**kwargs展开的开销"""
+        return cls(data['rssi_6gh'], data['rssi_6gl'])
 
-@dataclass
+@dataclass(slots=True)
 class TopologyNode:
     parent: Optional[str]
     backhaul_band: Optional[str]
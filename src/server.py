@@ -1,39 +1,59 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware import Middleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 from pydantic import BaseModel
-from .api import generate_topology as topology_generator
+from .api import generate_topology_from_data
 from .maps import router as maps_router
-import json
+from .jsonutil import loads as _loads
 from .logger_config import setup_logger
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
+import asyncio
+import logging
 import os
-from typing import List, Dict
+from typing import Any, Dict, List, Optional
+import aiofiles
 import uvicorn
 
 # 配置日志
 logger = setup_logger(__name__, '/var/log/topo-planner/topo-planner.log')
 
-class CSPMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://maps.googleapis.com; "
-            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
-            "img-src 'self' data: https://*.googleapis.com https://*.gstatic.com; "
-            "font-src 'self' https://cdn.jsdelivr.net; "
-            "connect-src 'self' https://*.googleapis.com"
-        )
-        return response
+# CSP策略是常量，导入时就编码为bytes
+_CSP_VALUE = (
+    b"default-src 'self'; "
+    b"script-src 'self' 'unsafe-inline' 'unsafe-eval' https://maps.googleapis.com; "
+    b"style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
+    b"img-src 'self' data: https://*.googleapis.com https://*.gstatic.com; "
+    b"font-src 'self' https://cdn.jsdelivr.net; "
+    b"connect-src 'self' https://*.googleapis.com"
+)
+# 整个header键值对也是常量，预组装成元组后每个响应只剩一次append
+_CSP_HEADER = (b"content-security-policy", _CSP_VALUE)
+
+class CSPMiddleware:
+    """纯ASGI中间件：不经过BaseHTTPMiddleware的Request/Response包装与任务调度"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append(_CSP_HEADER)
+                message["headers"] = headers
+            await send(message)
 
-app = FastAPI(middleware=[
+        await self.app(scope, receive, send_wrapper)
+
+app = FastAPI(default_response_class=ORJSONResponse, middleware=[
     Middleware(CSPMiddleware),
     Middleware(
         CORSMiddleware,
@@ -48,45 +68,59 @@ app.mount("/static", StaticFiles(directory="/app/static"), name="static")
 
 app.include_router(maps_router, prefix="/api/maps", tags=["maps"])
 
+# 首页内容启动时读入内存，每次请求直接返回bytes，省去逐请求的打开/读取/解码
+_INDEX_HTML = open('/app/static/index.html', 'rb').read()
+
 @app.get("/", response_class=HTMLResponse)
 async def get_index():
-    return open('/app/static/index.html').read()
+    return HTMLResponse(_INDEX_HTML)
 
 @app.get("/api/results")
 async def get_results():
     from .api import list_topology_results
-    return list_topology_results()
+    # 目录遍历和文件读取是同步I/O，放到线程池执行，不阻塞事件循环
+    return await asyncio.to_thread(list_topology_results)
 
 @app.get("/api/result/{filename}")
 async def get_result(filename: str):
     filepath = os.path.join("/app/results", filename)
     if not os.path.exists(filepath):
         raise HTTPException(status_code=404, detail="Result not found")
-        
-    with open(filepath, 'r') as f:
-        return json.load(f)
 
+    # 异步读取，磁盘I/O期间事件循环可继续处理其他连接
+    async with aiofiles.open(filepath, 'rb') as f:
+        return _loads(await f.read())
+
+# 节点/边直接声明为dict：Pydantic解析请求体时一次完成，
+# 不再传JSON字符串进来二次解析
 class TopologyRequest(BaseModel):
-    nodes_json: str
-    edges_json: str
-    config_json: str = None
+    nodes: Dict[str, Dict[str, Any]]
+    edges: Dict[str, Dict[str, Any]]
+    config: Optional[Dict[str, Any]] = None
 
 @app.post("/generate_topology")
 async def handle_topology_request(request: TopologyRequest):
     try:
-        logger.debug(f"接收到请求数据: nodes_json长度={len(request.nodes_json)}, "
-                    f"edges_json长度={len(request.edges_json)}")
-        
-        result = topology_generator(
-            request.nodes_json,
-            request.edges_json,
-            request.config_json
+        # 惰性格式化并用isEnabledFor短路，INFO级别下不做len()和字符串构造
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("接收到请求数据: %d个节点, %d条边",
+                         len(request.nodes), len(request.edges))
+
+        # 生成是CPU密集的同步代码，放到工作线程执行，
+        # Prim主循环期间事件循环仍可响应其他请求
+        result = await asyncio.to_thread(
+            generate_topology_from_data,
+            request.nodes,
+            request.edges,
+            request.config
+        )
+
+        # 生成器返回的已是序列化好的UTF-8字节串，直接拼进外层响应，
+        # 省去一次完整的解析+再序列化往返
+        return Response(
+            content=b'{"status":"success","data":' + result + b'}',
+            media_type="application/json"
         )
-        
-        return {
-            "status": "success",
-            "data": json.loads(result)
-        }
     
     except Exception as e:
         logger.error(f"处理请求时发生错误: {str(e)}", exc_info=True)
@@ -100,10 +134,21 @@ async def health_check():
     return {"status": "ok"}
 
 if __name__ == "__main__":
+    # 置TOPO_DEV=1进入开发模式（debug日志+热重载）；
+    # 生产模式关闭访问日志和代理头中间件，两者在小响应上开销显著
+    _dev = os.getenv("TOPO_DEV", "0") == "1"
     uvicorn.run(
         "src.server:app",
         host="0.0.0.0",
         port=8080,
-        log_level="debug",
-        reload=True
-    ) 
\ No newline at end of file
+        # 显式指定uvloop/httptools，缺少standard扩展时直接报错而不是静默降级
+        loop="uvloop",
+        http="httptools",
+        log_level="debug" if _dev else "info",
+        reload=_dev,
+        access_log=_dev,
+        proxy_headers=False,
+        # 拓扑生成是CPU密集型，多进程绕开GIL串行化；
+        # 进程数可用WEB_CONCURRENCY覆盖，reload模式下uvicorn只支持单worker
+        workers=1 if _dev else int(os.environ.get("WEB_CONCURRENCY", os.cpu_count()))
+    )
\ No newline at end of file
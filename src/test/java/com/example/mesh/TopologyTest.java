@@ -33,10 +33,10 @@ public class TopologyTest {
         System.out.println("Nodes: " + mapper.writeValueAsString(testData.nodes));
         System.out.println("Edges: " + mapper.writeValueAsString(testData.edges));
         
-        // 转换为JSON
+        // 转换为JSON（节点/边直接作为对象传入，服务端解析一次即可）
         String requestBody = mapper.writeValueAsString(Map.of(
-            "nodes_json", mapper.writeValueAsString(testData.nodes),
-            "edges_json", mapper.writeValueAsString(testData.edges)
+            "nodes", testData.nodes,
+            "edges", testData.edges
         ));
 
         // 创建HTTP请求
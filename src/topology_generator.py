@@ -13,56 +13,73 @@ logger = setup_logger(__name__, '/var/log/topo-planner/topo-planner.log')
 class TopologyGenerator:
     def __init__(self, config: TopologyConfig):
         self.config = config
+        # 每个节点当前的子节点数，入树时O(1)递增，替代对整棵树的重扫
+        self._child_count: Dict[str, int] = {}
         logger.info(f"初始化拓扑生成器，配置参数: {config}")
     
     def _predict_throughput(self, rssi: int) -> float:
         """根据RSSI预测吞吐量的简单线性模型"""
-        logger.debug(f"预测吞吐量 - 输入RSSI: {rssi}")
-        throughput = max(0, (rssi + 100) * 10)  # 简单示例：RSSI=-70时吞吐量为300Mbps
-        logger.debug(f"预测吞吐量结果: {throughput}Mbps")
-        return throughput
+        # 每条边都会调用，不打debug日志，避免热路径上的字符串构造
+        return max(0, (rssi + 100) * 10)  # 简单示例：RSSI=-70时吞吐量为300Mbps
     
+    def _precompute_edge_scores(self,
+                               nodes: Dict[str, NodeInfo],
+                               edges: Dict[Tuple[str, str], EdgeInfo]) -> Dict[Tuple[str, str], float]:
+        """预计算每条边与树结构无关的静态得分
+
+        吞吐量和负载项只取决于边和两端节点，整个生成过程中不变，
+        在进入主循环前一次性算完，热循环里只剩跳数一项。
+        """
+        scores = {}
+        # 权重提升为局部变量，省去循环内的属性查找
+        w_throughput = self.config.THROUGHPUT_WEIGHT
+        w_load = self.config.LOAD_WEIGHT
+        for (n1, n2), edge in edges.items():
+            node1 = nodes.get(n1)
+            node2 = nodes.get(n2)
+            # 端点不在节点表中的边直接跳过，与原实现从不触达这类边的行为一致
+            if node1 is None or node2 is None:
+                logger.warning("边 %s-%s 的端点不在节点列表中，已忽略", n1, n2)
+                continue
+            throughput = self._predict_throughput(edge.rssi_max)
+            total_load = node1.load + node2.load
+            scores[(n1, n2)] = w_throughput * throughput + w_load * total_load
+        return scores
+
+    def _build_adjacency(self,
+                        edges: Dict[Tuple[str, str], EdgeInfo]) -> Dict[str, List[Tuple[str, EdgeInfo]]]:
+        """按端点预建邻接表
+
+        边表是稀疏的，原先对selected×unselected的每个组合都做两次哈希
+        探测；邻接表只建一次，之后只遍历真实存在的邻边。
+        """
+        adj: Dict[str, List[Tuple[str, EdgeInfo]]] = {}
+        for (n1, n2), edge in edges.items():
+            adj.setdefault(n1, []).append((n2, edge))
+            adj.setdefault(n2, []).append((n1, edge))
+        return adj
+
     def _calculate_edge_weight(self,
                              parent: str,
                              child: str,
-                             nodes: Dict[str, NodeInfo],
-                             edges: Dict[Tuple[str, str], EdgeInfo],
+                             edge_scores: Dict[Tuple[str, str], float],
                              current_tree: Dict[str, TopologyNode]) -> float:
         """计算边的权重"""
-        logger.debug(f"计算边权重 - 父节点: {parent}, 子节点: {child}")
-        
-        edge = edges.get((parent, child)) or edges.get((child, parent))
-        if not edge:
-            logger.warning(f"未找到边连接: {parent}-{child}")
+        # 边按规范键（端点排序）存储，单次查找覆盖两个方向
+        score = edge_scores.get((parent, child) if parent < child else (child, parent))
+        if score is None:
+            logger.warning("未找到边连接: %s-%s", parent, child)
             return float('-inf')
-        
-        # 获取最好的RSSI值
-        rssi = max(edge.rssi_6gh + edge.rssi_6gl)
-        logger.debug(f"最大RSSI值: {rssi}")
-        
-        # 计算预测吞吐量
-        throughput = self._predict_throughput(rssi)
-        logger.debug(f"预测吞吐量: {throughput}")
-        
-        # 计算节点负载
-        total_load = nodes[parent].load + nodes[child].load
-        logger.debug(f"总负载: {total_load}")
-        
+
         # 计算父节点跳数
         parent_hops = current_tree[parent].level if parent in current_tree else 0
-        logger.debug(f"父节点跳数: {parent_hops}")
-        
-        # 加权计算
-        weight = (self.config.THROUGHPUT_WEIGHT * throughput +
-                 self.config.LOAD_WEIGHT * total_load +
-                 self.config.HOP_WEIGHT * parent_hops)
-        
-        logger.info(f"边权重计算完成: {parent}-{child}, 权重={weight}")
-        return weight
+
+        # 静态得分加上跳数项；每个候选边都会走到这里，不打debug日志
+        return score + self.config.HOP_WEIGHT * parent_hops
     
     def _check_rssi_constraint(self, edge: EdgeInfo) -> bool:
         """检查RSSI约束"""
-        return (max(edge.rssi_6gh + edge.rssi_6gl) >= self.config.RSSI_THRESHOLD)
+        return edge.rssi_max >= self.config.RSSI_THRESHOLD
     
     def _check_frequency_constraint(self,
                                   parent: str,
@@ -79,8 +96,7 @@ class TopologyGenerator:
         """检查度约束"""
         if parent not in current_tree:
             return True
-        child_count = sum(1 for node in current_tree.values() if node.parent == parent)
-        return child_count < self.config.MAX_DEGREE
+        return self._child_count.get(parent, 0) < self.config.MAX_DEGREE
     
     def _check_hop_constraint(self,
                             parent: str,
@@ -97,8 +113,9 @@ class TopologyGenerator:
                           edges: Dict[Tuple[str, str], EdgeInfo],
                           current_tree: Dict[str, TopologyNode]) -> bool:
         """检查所有约束条件"""
-        edge = edges.get((parent, child)) or edges.get((child, parent))
-        if not edge:
+        # 规范键单次查找
+        edge = edges.get((parent, child) if parent < child else (child, parent))
+        if edge is None:
             return False
             
         return (self._check_rssi_constraint(edge) and
@@ -109,127 +126,91 @@ class TopologyGenerator:
     def _generate_tree(self,
                       nodes: Dict[str, NodeInfo],
                       edges: Dict[Tuple[str, str], EdgeInfo]) -> Dict[str, TopologyNode]:
-        """使用改进的Prim算法生成最大生成树"""
-        try:
-            if not nodes:
-                raise TopologyGenerationError("节点列表为空")
-                
-            root_node = next(iter(nodes))
-            selected: Set[str] = {root_node}
-            unselected = set(nodes.keys()) - selected
-            
-            # 初始化树结构
-            tree: Dict[str, TopologyNode] = {
-                root_node: TopologyNode(
-                    parent=None,
-                    backhaul_band=None,
-                    level=0,
-                    channel=[],
-                    bandwidth=[],
-                    max_eirp=[],
-                    gps=nodes[root_node].gps
-                )
-            }
-            
-            iteration_count = 0
-            max_iterations = len(nodes) * 2  # 防止无限循环
-            
-            while unselected and iteration_count < max_iterations:
-                best_edge = self._find_best_edge(selected, unselected, nodes, edges, tree)
-                if not best_edge:
-                    logger.warning(f"无法找到更多有效边，剩余 {len(unselected)} 个未连接节点")
-                    break
-                    
-                parent, child, weight = best_edge
-                
-                # 验证边的有效性
-                if weight <= float('-inf'):
-                    raise TopologyGenerationError(f"检测到无效的边权重: {parent}-{child}")
-                    
-                # 确定回程频段
-                parent_level = tree[parent].level
-                backhaul_band = 'H' if parent_level % 2 == 0 else 'L'
-                
-                # 更新树结构
-                tree[child] = TopologyNode(
-                    parent=parent,
-                    backhaul_band=backhaul_band,
-                    level=parent_level + 1,
-                    channel=[],
-                    bandwidth=[],
-                    max_eirp=[],
-                    gps=nodes[child].gps
-                )
-                
-                # 更新节点集合
-                selected.add(child)
-                unselected.remove(child)
-                iteration_count += 1
-                
-            if iteration_count >= max_iterations:
-                raise TopologyGenerationError("超过最大迭代次数限制")
-                
-            if unselected:
-                logger.warning(f"存在未连接的节点: {unselected}")
-                
-            return tree
-            
-        except Exception as e:
-            if isinstance(e, TopologyGenerationError):
-                raise
-            raise TopologyGenerationError(f"生成树过程发生错误: {str(e)}")
-    
-    def _find_best_edge(self,
-                        selected: Set[str],
-                        unselected: Set[str],
-                        nodes: Dict[str, NodeInfo],
-                        edges: Dict[Tuple[str, str], EdgeInfo],
-                        current_tree: Dict[str, TopologyNode]) -> Optional[Tuple[str, str, float]]:
-        """
-        找到最佳边
-        
-        Args:
-            selected: 已选择的节点集合
-            unselected: 未选择的节点集合
-            nodes: 所有节点信息
-            edges: 所有边信息
-            current_tree: 当前已生成的树结构
-            
-        Returns:
-            最佳边的三元组 (父节点, 子节点, 权重)，如果没有合法边则返回None
+        """使用改进的Prim算法生成最大生成树
+
+        输入在进入主循环前一次性校验，循环本体不再包broad except，
+        控制流保持无异常的快速路径。
         """
-        valid_edges = []
-        
-        # 遍历所有可能的边
-        for parent in selected:
-            for child in unselected:
-                # 检查是否存在这条边（考虑双向）
-                edge_key = (parent, child)
-                reverse_edge_key = (child, parent)
-                
-                if edge_key not in edges and reverse_edge_key not in edges:
+        # 边界校验只在入口做一次
+        if not nodes:
+            raise TopologyGenerationError("节点列表为空")
+
+        root_node = next(iter(nodes))
+        selected: Set[str] = {root_node}
+        unselected = set(nodes.keys()) - selected
+
+        # 静态边得分和邻接表都只算一次
+        edge_scores = self._precompute_edge_scores(nodes, edges)
+        adj = self._build_adjacency(edges)
+        self._child_count = {}
+
+        # 初始化树结构
+        tree: Dict[str, TopologyNode] = {
+            root_node: TopologyNode(
+                parent=None,
+                backhaul_band=None,
+                level=0,
+                channel=[],
+                bandwidth=[],
+                max_eirp=[],
+                gps=nodes[root_node].gps
+            )
+        }
+
+        # 整个生成过程维护单个候选堆：节点入树时推入它的邻边，
+        # 弹出时惰性跳过过期项。入堆时父节点层级已定、权重不会再变，
+        # 度约束只会收紧，所以弹出时复查一次约束即可安全丢弃。
+        # 总代价从每轮重扫的O(V·E)降到O(E log E)
+        candidates: List[Tuple[float, str, str]] = []
+
+        def push_edges(parent: str) -> None:
+            for child, edge in adj.get(parent, ()):
+                if child in selected:
                     continue
-                    
-                # 检查所有约束条件
-                if not self._check_constraints(parent, child, nodes, edges, current_tree):
+                weight = self._calculate_edge_weight(parent, child, edge_scores, tree)
+                if weight <= float('-inf'):
                     continue
-                    
-                # 计算边的权重
-                weight = self._calculate_edge_weight(parent, child, nodes, edges, current_tree)
-                
-                # 将合法边加入候选集合
-                # 使用负权重是因为heapq实现的是最小堆，而我们需要最大权重
-                heapq.heappush(valid_edges, (-weight, parent, child))
-        
-        # 如果没有合法边，返回None
-        if not valid_edges:
-            return None
-            
-        # 返回权重最大的边
-        # heapq.heappop返回的是(-weight, parent, child)
-        # 我们需要转换回正权重并返回(parent, child, weight)的格式
-        neg_weight, parent, child = heapq.heappop(valid_edges)
-        return (parent, child, -neg_weight)
+                # heapq是最小堆，取负实现最大权重优先
+                heapq.heappush(candidates, (-weight, parent, child))
+
+        push_edges(root_node)
+
+        while unselected and candidates:
+            neg_weight, parent, child = heapq.heappop(candidates)
+
+            # 惰性删除：子节点已入树的过期项直接跳过
+            if child in selected:
+                continue
+
+            # 入堆后父节点的度可能已满，弹出时复查约束
+            if not self._check_constraints(parent, child, nodes, edges, tree):
+                continue
+
+            # 确定回程频段
+            parent_level = tree[parent].level
+            backhaul_band = 'H' if parent_level % 2 == 0 else 'L'
+
+            # 更新树结构
+            tree[child] = TopologyNode(
+                parent=parent,
+                backhaul_band=backhaul_band,
+                level=parent_level + 1,
+                channel=[],
+                bandwidth=[],
+                max_eirp=[],
+                gps=nodes[child].gps
+            )
+
+            # 更新节点集合与父节点度计数，并解锁新节点的邻边
+            selected.add(child)
+            unselected.remove(child)
+            self._child_count[parent] = self._child_count.get(parent, 0) + 1
+            push_edges(child)
+
+        if unselected:
+            logger.warning(f"无法找到更多有效边，存在未连接的节点: {unselected}")
+
+        return tree
     
     def generate(self, nodes: Dict[str, NodeInfo], edges: Dict[Tuple[str, str], EdgeInfo]) -> Dict[str, TopologyNode]:
         """
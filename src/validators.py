@@ -1,5 +1,5 @@
 from typing import Dict, Any, Tuple
-import json
+from .jsonutil import loads as _loads, JSONDecodeError
 from .config import TopologyConfig
 from .models import NodeInfo, EdgeInfo
 from .exceptions import InvalidInputError, ValidationError
@@ -8,6 +8,14 @@ from .logger_config import setup_logger
 # 配置日志
 logger = setup_logger(__name__, '/var/log/topo-planner/topo-planner.log')
 
+# 默认配置在进程内共享，生成器只读不改，无需每个请求都重新构造
+_DEFAULT_CONFIG = TopologyConfig()
+
+# 验证规则中的常量在导入时构建一次，不在每次调用里重建
+_REQUIRED_NODE_FIELDS = frozenset({'gps', 'load', 'channels', 'max_eirp'})
+_REQUIRED_EDGE_FIELDS = frozenset({'rssi_6gh', 'rssi_6gl'})
+_RSSI_FIELDS = ('rssi_6gh', 'rssi_6gl')
+
 def validate_node_data(node_data: Dict[str, Any]) -> None:
     """
     验证节点数据的有效性
@@ -18,18 +26,18 @@ def validate_node_data(node_data: Dict[str, Any]) -> None:
     Raises:
         ValidationError: 当数据验证失败时
     """
-    logger.debug(f"开始验证节点数据: {node_data}")
+    logger.debug("开始验证节点数据: %s", node_data)
     
     try:
         # 检查必要字段
-        required_fields = {'gps', 'load', 'channels', 'max_eirp'}
-        missing_fields = required_fields - set(node_data.keys())
+        # dict视图直接参与集合运算，无需先拷贝成set
+        missing_fields = _REQUIRED_NODE_FIELDS - node_data.keys()
         if missing_fields:
             logger.error(f"节点数据缺少必要字段: {missing_fields}")
             raise ValidationError(
                 message=f"节点数据缺少必要字段",
                 field=list(missing_fields),
-                constraints={'required_fields': list(required_fields)}
+                constraints={'required_fields': list(_REQUIRED_NODE_FIELDS)}
             )
             
         # 验证GPS数据
@@ -91,32 +99,32 @@ def validate_edge_data(edge_info: Dict[str, Any], edge_key: str) -> None:
     Raises:
         ValidationError: 当数据验证失败时
     """
-    logger.debug(f"开始验证边数据: {edge_key} -> {edge_info}")
+    logger.debug("开始验证边数据: %s -> %s", edge_key, edge_info)
     
     try:
         # 检查必要字段
-        required_fields = {'rssi_6gh', 'rssi_6gl'}
-        missing_fields = required_fields - set(edge_info.keys())
+        missing_fields = _REQUIRED_EDGE_FIELDS - edge_info.keys()
         if missing_fields:
             logger.error(f"边数据缺少必要字段: {missing_fields}")
             raise ValidationError(
                 message=f"边数据缺少必要字段",
                 field=list(missing_fields),
-                constraints={'required_fields': list(required_fields)}
+                constraints={'required_fields': list(_REQUIRED_EDGE_FIELDS)}
             )
-            
-        # 验证RSSI数据格式
-        for field in ['rssi_6gh', 'rssi_6gl']:
-            if not isinstance(edge_info[field], list) or len(edge_info[field]) != 2:
+
+        # 验证RSSI数据格式（字段值取一次，格式和范围检查共用）
+        for field in _RSSI_FIELDS:
+            values = edge_info[field]
+            if not isinstance(values, list) or len(values) != 2:
                 raise ValidationError(
                     message=f"{field}数据格式无效",
                     field=field,
-                    value=edge_info[field],
+                    value=values,
                     constraints={'format': '[rssi_forward, rssi_backward]'}
                 )
-            
+
             # 验证RSSI值范围
-            for rssi in edge_info[field]:
+            for rssi in values:
                 if not isinstance(rssi, (int, float)) or rssi > 0 or rssi < -100:
                     raise ValidationError(
                         message=f"{field}值范围无效",
@@ -137,66 +145,104 @@ def validate_edge_data(edge_info: Dict[str, Any], edge_key: str) -> None:
             value=edge_info
         )
 
-def validate_topology_input(nodes_json: str, edges_json: str, config_json: str = None) -> Tuple[Dict[str, NodeInfo], Dict[tuple, EdgeInfo], TopologyConfig]:
+def validate_topology_data(nodes_data: Dict[str, Any],
+                           edges_data: Dict[str, Any],
+                           config_data: Dict[str, Any] = None) -> Tuple[Dict[str, NodeInfo], Dict[tuple, EdgeInfo], TopologyConfig]:
     """
-    验证并转换拓扑输入数据
-    
+    验证并转换已解析的拓扑输入数据
+
+    HTTP层由Pydantic解析请求体后直接传入dict，这里不再做JSON解析，
+    避免同一份数据被解析两次。
+
     Args:
-        nodes_json: 节点信息的JSON字符串
-        edges_json: 边信息的JSON字符串
-        config_json: 可选的配置信息JSON字符串
-        
+        nodes_data: 节点信息字典
+        edges_data: 边信息字典
+        config_data: 可选的配置信息字典
+
     Returns:
         转换后的节点字典、边字典和配置对象的元组
     """
     try:
-        # 解析JSON
-        try:
-            nodes_data = json.loads(nodes_json)
-            edges_data = json.loads(edges_json)
-            logger.debug(f"成功解析JSON数据: {len(nodes_data)}个节点, {len(edges_data)}条边")
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON解析失败: {e}")
-            raise InvalidInputError(f"JSON解析错误: {str(e)}")
-        
-        # 验证节点和边数据
+        # 验证并转换节点数据：单次遍历，验证通过即构造
+        # （构造函数绑定为局部变量，减少循环内的全局查找）
+        _make_node = NodeInfo._from_raw
+        nodes = {}
         for node_id, node_info in nodes_data.items():
             validate_node_data(node_info)
-        
+            try:
+                nodes[node_id] = _make_node(node_info)
+            except Exception as e:
+                raise InvalidInputError(f"节点数据转换失败: {str(e)}")
+
+        # 验证并转换边数据
+        _make_edge = EdgeInfo._from_raw
+        edges = {}
         for edge_key, edge_info in edges_data.items():
             validate_edge_data(edge_info, edge_key)
-            
-        # 转换节点数据
-        try:
-            nodes = {
-                node_id: NodeInfo(**node_info)
-                for node_id, node_info in nodes_data.items()
-            }
-        except Exception as e:
-            raise InvalidInputError(f"节点数据转换失败: {str(e)}")
-            
-        # 转换边数据
-        try:
-            edges = {
-                tuple(edge_key.split('_')): EdgeInfo(**edge_info)
-                for edge_key, edge_info in edges_data.items()
-            }
-        except Exception as e:
-            raise InvalidInputError(f"边数据转换失败: {str(e)}")
+            try:
+                # partition单次C调用返回三元组，比index加两次切片更直接
+                head, sep, tail = edge_key.partition('_')
+                if not sep:
+                    raise ValueError(f"边标识缺少'_'分隔符: {edge_key}")
+                # 无向边统一用排序后的规范键存储，查找时单次哈希探测即可
+                key = (head, tail) if head < tail else (tail, head)
+                edges[key] = _make_edge(edge_info)
+            except Exception as e:
+                raise InvalidInputError(f"边数据转换失败: {str(e)}")
             
         # 配置初始化
-        config = TopologyConfig()
-        if config_json:
+        config = _DEFAULT_CONFIG
+        if config_data:
+            # 先对照dataclass字段检查键名，未知键直接报错而不是吞进构造异常
+            unknown_keys = config_data.keys() - TopologyConfig.__dataclass_fields__.keys()
+            if unknown_keys:
+                logger.error(f"配置包含未知字段: {unknown_keys}")
+                raise InvalidInputError(
+                    f"配置包含未知字段: {sorted(unknown_keys)}",
+                    field='config',
+                    value=sorted(unknown_keys)
+                )
+
             try:
-                config_data = json.loads(config_json)
                 config = TopologyConfig(**config_data)
             except Exception as e:
                 raise InvalidInputError(f"配置数据无效: {str(e)}")
                 
         return nodes, edges, config
-        
+
     except (ValidationError, InvalidInputError):
         raise
     except Exception as e:
         logger.error(f"输入数据验证过程发生未预期错误: {str(e)}", exc_info=True)
-        raise InvalidInputError(f"输入数据验证失败: {str(e)}")
\ No newline at end of file
+        raise InvalidInputError(f"输入数据验证失败: {str(e)}")
+
+def validate_topology_input(nodes_json: str, edges_json: str, config_json: str = None) -> Tuple[Dict[str, NodeInfo], Dict[tuple, EdgeInfo], TopologyConfig]:
+    """
+    验证并转换JSON字符串形式的拓扑输入数据
+
+    Args:
+        nodes_json: 节点信息的JSON字符串
+        edges_json: 边信息的JSON字符串
+        config_json: 可选的配置信息JSON字符串
+
+    Returns:
+        转换后的节点字典、边字典和配置对象的元组
+    """
+    # 解析JSON
+    try:
+        nodes_data = _loads(nodes_json)
+        edges_data = _loads(edges_json)
+        logger.debug("成功解析JSON数据: %d个节点, %d条边", len(nodes_data), len(edges_data))
+    except JSONDecodeError as e:
+        logger.error(f"JSON解析失败: {e}")
+        raise InvalidInputError(f"JSON解析错误: {str(e)}")
+    except Exception as e:
+        logger.error(f"输入数据验证过程发生未预期错误: {str(e)}", exc_info=True)
+        raise InvalidInputError(f"输入数据验证失败: {str(e)}")
+
+    try:
+        config_data = _loads(config_json) if config_json else None
+    except Exception as e:
+        raise InvalidInputError(f"配置数据无效: {str(e)}")
+
+    return validate_topology_data(nodes_data, edges_data, config_data)
\ No newline at end of file